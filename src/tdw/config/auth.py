@@ -5,8 +5,83 @@ This module provides authentication mechanisms for different interfaces, includi
 and PostgreSQL database connectivity.
 """
 
+import atexit
+import functools
 import os
-import psycopg2
+import threading
+from psycopg2 import pool
+from psycopg2.extras import execute_batch
+
+
+_POOLS = {}
+# Guards first-time pool creation when concurrent ingest workers construct
+# PostgresAuth instances for the same connection parameters
+_POOLS_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_pg_env() -> dict:
+    """
+    Read the POSTGRES_* environment variables once and cache the result.
+
+    Environment variables do not change after process start, so the lookup is
+    cached at module scope and shared by every PostgresAuth instance instead of
+    re-reading the environment on each construction.
+
+    Returns:
+        dict: A dictionary with keys "host", "user", "password", and "dbname".
+    """
+    return {
+        "host": os.getenv("POSTGRES_HOST"),
+        "user": os.getenv("POSTGRES_USER"),
+        "password": os.getenv("POSTGRES_PASSWORD"),
+        "dbname": os.getenv("POSTGRES_DB"),
+    }
+
+
+def _get_pool(connection_config: dict):
+    """
+    Return a shared ThreadedConnectionPool for the given connection configuration.
+
+    Pools are created lazily on first use and cached at module level, keyed by the
+    connection parameters, so every PostgresAuth instance pointing at the same
+    database reuses the same pool instead of opening a fresh TCP/auth handshake.
+    The maximum pool size can be tuned via the POSTGRES_POOL_MAX environment
+    variable (defaults to 10). Creation is guarded by a double-checked lock so
+    concurrent first callers cannot each build (and leak) a pool for the same key.
+
+    Args:
+        connection_config (dict): Connection parameters with keys "host", "port",
+            "dbname", "user" and "password".
+
+    Returns:
+        psycopg2.pool.ThreadedConnectionPool: The pool serving this configuration.
+    """
+    key = frozenset(connection_config.items())
+    if key not in _POOLS:
+        with _POOLS_LOCK:
+            if key not in _POOLS:
+                _POOLS[key] = pool.ThreadedConnectionPool(
+                    minconn=1,
+                    maxconn=int(os.getenv("POSTGRES_POOL_MAX", "10")),
+                    host=connection_config.get("host"),
+                    port=connection_config.get("port"),
+                    database=connection_config.get("dbname"),
+                    user=connection_config.get("user"),
+                    password=connection_config.get("password"),
+                )
+    return _POOLS[key]
+
+
+def _close_pools():
+    """Close all pooled connections on interpreter shutdown."""
+    for connection_pool in _POOLS.values():
+        if not connection_pool.closed:
+            connection_pool.closeall()
+    _POOLS.clear()
+
+
+atexit.register(_close_pools)
 
 
 class BaseAPIAuth:
@@ -52,6 +127,7 @@ class PostgresAuth:
 
     Attributes:
         config (dict): The initial source configuration provided at instantiation.
+        auth_details (dict): The cached PostgreSQL credentials resolved from environment variables.
         _conn (psycopg2.extensions.connection): The active PostgreSQL connection instance.
         jdbc_url (str): The constructed JDBC URL for the PostgreSQL database.
         connection_config (dict): A dictionary containing connection parameters such as host, dbname,
@@ -67,52 +143,111 @@ class PostgresAuth:
     def __init__(self, source_config):
         self.config = source_config
         self._conn = None
-        self.jdbc_url = self.get_jdbc_url()
-        self.connection_config = self.get_connection_config()
+        self._cursor = None
 
+        # Single derivation pass: resolve credentials once and build every
+        # connection artifact from the same dict
+        self.auth_details = self.get_auth()
         self.port = "5432"
-        self.user = self.connection_config.get("user")
-        self.host = self.connection_config.get("host")
-        self.dbname = self.connection_config.get("dbname")
-        self.password = self.connection_config.get("password")
+        self.user = self.auth_details.get("user")
+        self.host = self.auth_details.get("host")
+        self.dbname = self.auth_details.get("dbname")
+        self.password = self.auth_details.get("password")
+
+        self.connection_config = {
+            "host": self.host,
+            "dbname": self.dbname,
+            "user": self.user,
+            "password": self.password,
+            "driver": "org.postgresql.Driver",
+        }
+        jdbc_port = os.getenv("POSTGRES_PORT", "5432")
+        self.jdbc_url = f"jdbc:postgresql://{self.host}:{jdbc_port}/{self.dbname}"
 
         self._conn = self.get_connection()
 
-        self.connection_properties = {"user": self.user, "password": self.password, "driver": "org.postgresql.Driver"}
+        self.connection_properties = {
+            "user": self.user,
+            "password": self.password,
+            "driver": "org.postgresql.Driver",
+            # Collapse batched INSERTs into multi-row statements on the PG driver side
+            "reWriteBatchedInserts": "true",
+            "batchsize": "10000",
+        }
 
     def get_connection(self):
         """
-        Attempt to establish a connection to the PostgreSQL database using the configured parameters.
+        Check out a connection to the PostgreSQL database from the shared connection pool.
 
-        This method uses psycopg2 to attempt a connection to the database. If successful, returns a connection object.
-        If the connection fails, a ConnectionError is raised with the underlying exception message.
+        The pool is created lazily on first use and shared across all PostgresAuth instances
+        with the same connection parameters, so repeated checkouts avoid the TCP/auth handshake
+        cost of opening a fresh connection. If the checkout fails, a ConnectionError is raised
+        with the underlying exception message.
 
         Returns:
             psycopg2.extensions.connection: A connection object for interacting with the PostgreSQL database.
 
         Raises:
-            ConnectionError: If the connection attempt fails.
+            ConnectionError: If a connection cannot be obtained from the pool.
         """
         try:
-            return psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                database=self.dbname,
-                user=self.user,
-                password=self.password,
-            )
+            return _get_pool(self._pool_config()).getconn()
         except Exception as e:
             raise ConnectionError(f"Failed to connect to PostgreSQL: {e}") from e
 
+    def _pool_config(self) -> dict:
+        """
+        Build the connection parameter dictionary used to key the shared pool.
+
+        Returns:
+            dict: A dictionary with keys "host", "port", "dbname", "user" and "password".
+        """
+        return {
+            "host": self.host,
+            "port": self.port,
+            "dbname": self.dbname,
+            "user": self.user,
+            "password": self.password,
+        }
+
+    def __enter__(self):
+        """
+        Enter the runtime context, ensuring a pooled connection is checked out.
+
+        Allows one PostgresAuth instance to serve a whole batch of ingestors:
+            with PostgresAuth(config) as target:
+                ...
+
+        Returns:
+            PostgresAuth: The current instance.
+        """
+        if self._conn is None:
+            self._conn = self.get_connection()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exit the runtime context, returning the connection to the shared pool.
+
+        Exceptions raised inside the context are propagated to the caller.
+        """
+        self.close_connection()
+        return False
+
     def close_connection(self):
         """
-        Closes the active connection if it exists and sets the connection attribute to None.
+        Returns the active connection to the shared pool if it exists and sets the
+        connection attribute to None. The underlying connection stays open for reuse;
+        pools are closed for real at interpreter shutdown.
 
         Returns:
             self: The current instance, enabling method chaining.
         """
+        if self._cursor:
+            self._cursor.close()
+            self._cursor = None
         if self._conn:
-            self._conn.close()
+            _get_pool(self._pool_config()).putconn(self._conn)
             self._conn = None
         return self
 
@@ -120,7 +255,8 @@ class PostgresAuth:
         """
         Return a dictionary containing PostgreSQL connection credentials.
 
-        This dictionary is constructed from environment variables:
+        This dictionary is constructed from environment variables and cached at
+        module scope by _load_pg_env:
             - "host": The PostgreSQL server address obtained from the POSTGRES_HOST variable.
             - "user": The username for the PostgreSQL connection from the POSTGRES_USER variable.
             - "password": The password associated with the given user from the POSTGRES_PASSWORD variable.
@@ -129,19 +265,13 @@ class PostgresAuth:
         Returns:
             dict: A dictionary with keys "host", "user", "password", and "dbname".
         """
-        return {
-            "host": os.getenv("POSTGRES_HOST"),
-            "user": os.getenv("POSTGRES_USER"),
-            "password": os.getenv("POSTGRES_PASSWORD"),
-            "dbname": os.getenv("POSTGRES_DB"),
-        }
+        return _load_pg_env()
 
     def get_connection_config(self):
         """
         Retrieve the database connection configuration.
 
-        This method obtains the authentication details by calling the `get_auth()` method
-        and constructs a dictionary containing the required connection parameters:
+        Pure accessor for the connection parameters derived once in `__init__`:
             - host: The hostname for the database connection.
             - dbname: The name of the database.
             - user: The username for authentication.
@@ -151,44 +281,48 @@ class PostgresAuth:
         Returns:
             dict: A dictionary with the database connection configuration.
         """
-        auth_details = self.get_auth()
-        self.connection_config = {
-            "host": auth_details.get("host"),
-            "dbname": auth_details.get("dbname"),
-            "user": auth_details.get("user"),
-            "password": auth_details.get("password"),
-            "driver": "org.postgresql.Driver",
-        }
         return self.connection_config
 
     def get_jdbc_url(self):
         """
-        Generate a JDBC URL for connecting to a PostgreSQL database.
+        Retrieve the JDBC URL for connecting to the PostgreSQL database.
 
-        This method retrieves the authentication details using get_auth(),
-        including the host and database name. The PostgreSQL port is obtained
-        from the environment variable "POSTGRES_PORT", defaulting to "5432" if not set.
-        It then constructs the JDBC URL in the format:
+        Pure accessor for the URL derived once in `__init__` in the format:
             jdbc:postgresql://<host>:<port>/<dbname>
+        where the port comes from the "POSTGRES_PORT" environment variable,
+        defaulting to "5432" if not set.
 
         Returns:
             str: The constructed JDBC URL.
         """
-        auth_details = self.get_auth()
-        host = auth_details.get("host")
-        dbname = auth_details.get("dbname")
-        port = os.getenv("POSTGRES_PORT", "5432")
-
-        self.jdbc_url = f"jdbc:postgresql://{host}:{port}/{dbname}"
         return self.jdbc_url
 
+    def _get_cursor(self):
+        """
+        Return the persistent cursor for this connection, creating it on first use.
+
+        Reusing one cursor across calls avoids re-allocating a cursor per statement
+        when execute is invoked in a loop.
+
+        Returns:
+            psycopg2.extensions.cursor: The persistent cursor bound to the active connection.
+
+        Raises:
+            ConnectionError: If no active PostgreSQL connection is available.
+        """
+        if not self._conn:
+            raise ConnectionError("No valid PostgreSQL connection.")
+        if self._cursor is None or self._cursor.closed:
+            self._cursor = self._conn.cursor()
+        return self._cursor
+
     def execute(self, sql: str, *params):
         """
         Execute a SQL query using an active PostgreSQL connection.
 
-        This method validates that a connection exists before creating a cursor to execute the
-        provided SQL string. It accepts additional parameters to bind securely into the query,
-        executes the query, and commits the transaction.
+        This method validates that a connection exists and executes the provided SQL
+        string on the persistent cursor. It accepts additional parameters to bind
+        securely into the query, executes the query, and commits the transaction.
 
         Args:
             sql (str): The SQL query string to execute.
@@ -197,8 +331,22 @@ class PostgresAuth:
         Raises:
             ConnectionError: If no active PostgreSQL connection is available.
         """
-        if not self._conn:
-            raise ConnectionError("No valid PostgreSQL connection.")
-        with self._conn.cursor() as cur:
-            cur.execute(sql, params)
-            self._conn.commit()
+        self._get_cursor().execute(sql, params)
+        self._conn.commit()
+
+    def execute_many(self, sql: str, seq_of_params):
+        """
+        Execute the same SQL statement for a sequence of parameter tuples in batches.
+
+        Uses psycopg2's execute_batch to group the statements into pages of 1000,
+        amortizing round-trips when the same statement is issued many times.
+
+        Args:
+            sql (str): The SQL statement to execute for each parameter tuple.
+            seq_of_params: An iterable of parameter tuples to bind into the statement.
+
+        Raises:
+            ConnectionError: If no active PostgreSQL connection is available.
+        """
+        execute_batch(self._get_cursor(), sql, seq_of_params, page_size=1000)
+        self._conn.commit()
@@ -7,9 +7,70 @@ reading both the primary configuration file ("config.yaml" by default) and
 source-specific configuration files located in designated directories.
 """
 
+import functools
 import os
 import yaml
 
+try:
+    # LibYAML's C parser is typically 5-10x faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_source_config(source_config_path: str, mtime: float) -> dict:
+    """
+    Parse and cache a source YAML config file, keyed by path and modification time.
+
+    Including the file's mtime in the cache key means an edited config is re-parsed
+    on the next load, while unchanged files skip the filesystem and parse cost
+    entirely for the lifetime of the process.
+
+    Parameters:
+        source_config_path (str): Absolute path to the source configuration file.
+        mtime (float): The file's modification time, used only as part of the cache key.
+
+    Returns:
+        dict: The configuration settings loaded from the YAML file.
+    """
+    with open(source_config_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _load_source_config(source_name: str) -> dict:
+    """
+    Load the configuration for a source from its YAML config file.
+
+    Constructs the file path under "tdw/ingest/datasets/{source_name}/config.yaml"
+    and delegates parsing to the mtime-keyed cache.
+
+    Parameters:
+        source_name (str): Name of the source configuration to load.
+
+    Returns:
+        dict: The configuration settings loaded from the YAML file.
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist at the specified path.
+    """
+    source_config_path = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+        "tdw",
+        "ingest",
+        "datasets",
+        source_name,
+        "config.yaml",
+    )
+    if not os.path.exists(source_config_path):
+        raise FileNotFoundError(f"Source configuration file not found: {source_config_path}")
+
+    try:
+        mtime = os.path.getmtime(source_config_path)
+    except OSError:
+        mtime = 0.0
+    return _parse_source_config(source_config_path, mtime)
+
 
 class ConfigLoader:
     """
@@ -44,8 +105,8 @@ class ConfigLoader:
         Load and return the input configuration from a YAML file.
 
         This method reads the configuration file located at self.input_config_path. If the file does not exist,
-        a FileNotFoundError is raised. Otherwise, the configuration is loaded using yaml.safe_load and stored in
-        self.input_config.
+        a FileNotFoundError is raised. Otherwise, the configuration is loaded and stored in self.input_config;
+        subsequent calls return the cached dictionary without touching the filesystem again.
 
         Returns:
             dict: The configuration data loaded from the YAML file.
@@ -53,20 +114,23 @@ class ConfigLoader:
         Raises:
             FileNotFoundError: If the configuration file is not found at self.input_config_path.
         """
+        if self.input_config is not None:
+            return self.input_config
+
         if not os.path.exists(self.input_config_path):
             raise FileNotFoundError(f"Configuration file not found: {self.input_config_path}")
 
         with open(self.input_config_path, "r", encoding="utf-8") as f:
-            self.input_config = yaml.safe_load(f)
+            self.input_config = yaml.load(f, Loader=SafeLoader)
         return self.input_config
 
     def load_source_config(self, source_name: str) -> dict:
         """
         Loads configuration for a specified source by reading its YAML config file.
 
-        Constructs the file path by navigating three directories up from the current file,
-        then appending "tdw/ingest/datasets/{source_name}/config.yaml". It then opens and parses
-        the YAML configuration file, returning the result as a dictionary.
+        Delegates to the module-level memoized loader, so the YAML file under
+        "tdw/ingest/datasets/{source_name}/config.yaml" is parsed at most once
+        per modification for the lifetime of the process.
 
         Parameters:
             source_name (str): Name of the source configuration to load.
@@ -77,17 +141,4 @@ class ConfigLoader:
         Raises:
             FileNotFoundError: If the configuration file does not exist at the specified path.
         """
-        source_config_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "tdw",
-            "ingest",
-            "datasets",
-            source_name,
-            "config.yaml",
-        )
-        if not os.path.exists(source_config_path):
-            raise FileNotFoundError(f"Source configuration file not found: {source_config_path}")
-
-        with open(source_config_path, "r", encoding="utf-8") as f:
-            source_config = yaml.safe_load(f)
-        return source_config
+        return _load_source_config(source_name)
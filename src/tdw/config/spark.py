@@ -9,12 +9,16 @@ ensuring that only one session is active at any time.
 
 import os
 import sys
+import threading
 from pyspark.sql import SparkSession
 
 
 os.environ["PYSPARK_PYTHON"] = sys.executable
 os.environ["PYSPARK_DRIVER_PYTHON"] = sys.executable
 
+# Guards first-time session creation when ingest workers call get_session concurrently
+_SESSION_LOCK = threading.Lock()
+
 
 def create_spark_session(app_name="LocalSparkSession", master="local[*]", **configs):
     """
@@ -22,9 +26,22 @@ def create_spark_session(app_name="LocalSparkSession", master="local[*]", **conf
     """
     builder = SparkSession.builder.appName(app_name).master(master)
 
-    # Example config: adding a package for PostgreSQL and reducing shuffle partitions
+    # Example config: adding a package for PostgreSQL and sizing shuffle partitions
     builder = builder.config("spark.jars.packages", "org.postgresql:postgresql:42.5.4")
-    builder = builder.config("spark.sql.shuffle.partitions", "10")
+    builder = builder.config("spark.sql.shuffle.partitions", str((os.cpu_count() or 4) * 2))
+    # Let adaptive execution coalesce (or split) shuffle partitions at runtime
+    # from actual shuffle statistics, so the static count above is only a ceiling
+    builder = builder.config("spark.sql.adaptive.enabled", "true")
+    builder = builder.config("spark.sql.adaptive.coalescePartitions.enabled", "true")
+    builder = builder.config("spark.sql.adaptive.skewJoin.enabled", "true")
+    builder = builder.config("spark.sql.adaptive.advisoryPartitionSizeInBytes", "64MB")
+    # Ship pandas DataFrames to the JVM as columnar Arrow batches instead of pickled rows
+    builder = builder.config("spark.sql.execution.arrow.pyspark.enabled", "true")
+    # Keep wide (flattened) ingest schemas inside a single generated method and
+    # cache columnar batches in larger compressed chunks
+    builder = builder.config("spark.sql.codegen.maxFields", "200")
+    builder = builder.config("spark.sql.inMemoryColumnarStorage.batchSize", "20000")
+    builder = builder.config("spark.sql.inMemoryColumnarStorage.compressed", "true")
 
     for key, value in configs.items():
         builder = builder.config(key, value)
@@ -35,8 +52,27 @@ def create_spark_session(app_name="LocalSparkSession", master="local[*]", **conf
 def get_session(app_name="LocalSparkSession", master="local[*]", **configs):
     """
     Returns the active Spark session, creating it if needed.
-    Caches the session on the function to avoid globals.
+    Caches the session on the function to avoid globals. Creation is guarded
+    by a double-checked lock so concurrent first callers (the per-source
+    ingest workers) cannot race to build two sessions.
+
+    Configs passed after the session exists are no longer silently dropped:
+    runtime-settable keys are applied to the running session via conf.set,
+    and keys the session rejects (static configs such as spark.jars.packages)
+    raise a ValueError so callers never proceed with a misconfigured session.
     """
-    if not hasattr(get_session, "session"):
-        get_session.session = create_spark_session(app_name, master, **configs)
-    return get_session.session
+    session = getattr(get_session, "session", None)
+    if session is None:
+        with _SESSION_LOCK:
+            session = getattr(get_session, "session", None)
+            if session is None:
+                session = create_spark_session(app_name, master, **configs)
+                get_session.session = session
+                return session
+    if configs:
+        for key, value in configs.items():
+            try:
+                session.conf.set(key, value)
+            except Exception as exc:
+                raise ValueError(f"Config '{key}' cannot be applied to the already-running Spark session.") from exc
+    return session
@@ -9,7 +9,7 @@ Key functionalities:
       the expected data structure, including support for nested (dictionary/list) types.
     - Reads data from an API endpoint using HTTP GET requests and processes pagination when enabled.
     - Parses and validates JSON responses, extracting data based on a configurable response path.
-    - Processes the DataFrame by appending a SHA-256 hash for row integrity and a timestamp for tracking.
+    - Processes the DataFrame by appending an xxHash64 row hash for change tracking and a timestamp.
     - Writes the processed DataFrame to a JDBC target using a dynamically generated table name.
     - Ensures target schemas are created if they do not already exist.
 
@@ -25,11 +25,41 @@ Note:
     - The module supports both paginated requests (via the _paginate method) and single API calls.
 """
 
+import functools
+import threading
+
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import yaml
 
+try:
+    # LibYAML's C parser is typically 5-10x faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    # Optional: stream-parse API responses in constant memory instead of
+    # materializing the wrapper dict with response.json()
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional: materialize driver-side results as a pandas DataFrame so Spark
+    # converts them to Arrow batches instead of pickling row by row
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    # Optional: orjson parses JSON payloads roughly 3x faster than stdlib json
+    import orjson
+except ImportError:
+    orjson = None
+
 from pyspark.sql import SparkSession
-from pyspark.sql.functions import col, sha2, concat_ws, current_timestamp
+from pyspark.sql.functions import col, xxhash64, current_timestamp
 from pyspark.sql.types import (
     StructType,
     StructField,
@@ -41,6 +71,263 @@ from pyspark.sql.types import (
     ArrayType,
 )
 
+from tdw.utils.helpers import flatten_nested_dict
+
+
+# Layers whose target schema this process has already ensured; a layer is shared
+# across datasets, so the CREATE SCHEMA round-trip only needs to happen once.
+# Creation is guarded by a lock: concurrent CREATE SCHEMA IF NOT EXISTS on
+# separate connections can still collide inside PostgreSQL
+_ENSURED_SCHEMAS = set()
+_ENSURED_SCHEMAS_LOCK = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """
+    Build a pooled keep-alive session with retries for transient gateway errors.
+
+    Returns:
+        requests.Session: A session with a mounted HTTPAdapter sized for many
+        concurrent connections.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One driver-level session shared by every ingestor, so TCP/TLS connections are
+# reused across datasets instead of being re-established per instance
+_SESSION = _build_session()
+
+
+# Primitive type singletons shared by every schema build; PySpark type objects
+# are immutable, so one instance each is enough for the whole process
+_TYPE_MAPPING = {
+    "float": FloatType(),
+    "integer": IntegerType(),
+    "string": StringType(),
+    "boolean": BooleanType(),
+    "timestamp": TimestampType(),
+}
+
+_NESTED_TYPES = ("dict", "dictionary", "list")
+
+
+def _build_nested_schema(schema_dict: dict) -> StructType:
+    """
+    Build a nested Spark StructType from a parsed schema dictionary.
+
+    Used for "list" columns, which keep their element structure: columns typed
+    as "dict"/"dictionary" become nested structs and columns typed as "list"
+    become arrays of structs. Nesting is handled with an explicit post-order
+    stack rather than recursion, and the field list for each level is
+    preallocated.
+
+    Args:
+        schema_dict (dict): A dictionary with a "columns" list describing the schema.
+
+    Returns:
+        StructType: A Spark StructType object representing the schema.
+    """
+    built = {}
+    stack = [(schema_dict, False)]
+    while stack:
+        node, children_done = stack.pop()
+        columns = node.get("columns", [])
+        if not children_done:
+            # Revisit this node once all of its nested children are built
+            stack.append((node, True))
+            for column in columns:
+                if column.get("type") in _NESTED_TYPES and "columns" in column:
+                    stack.append((column, False))
+            continue
+
+        fields = [None] * len(columns)
+        for i, column in enumerate(columns):
+            col_name = column.get("name")
+            col_type = column.get("type")
+            if col_type in _NESTED_TYPES and "columns" in column:
+                nested_schema = built[id(column)]
+                field_type = ArrayType(nested_schema) if col_type == "list" else nested_schema
+            else:
+                field_type = _TYPE_MAPPING.get(col_type, StringType())
+            fields[i] = StructField(col_name, field_type, True)
+        built[id(node)] = StructType(fields)
+
+    return built[id(schema_dict)]
+
+
+def _build_schema(schema_dict: dict) -> tuple:
+    """
+    Build the ingest StructType, flattening nested dictionary columns.
+
+    Columns typed "dict"/"dictionary" are expanded into one primitive column per
+    leaf with underscore-joined names (matching helpers.flatten_nested_dict), so
+    the ingest schema stays JDBC-storable and downstream SQL sees native columns
+    instead of structs. "list" columns keep their element structure as arrays,
+    mirroring the flattener, which treats lists as leaf values.
+
+    Args:
+        schema_dict (dict): A dictionary with a "columns" list describing the schema.
+
+    Returns:
+        tuple: (StructType, bool) — the flat schema and whether any dictionary
+        column was flattened (i.e. whether records need flattening at ingest).
+    """
+    fields = []
+    needs_flatten = False
+    stack = [(column, ()) for column in reversed(schema_dict.get("columns", []))]
+    while stack:
+        column, path = stack.pop()
+        col_name = column.get("name")
+        col_type = column.get("type")
+        if col_type in ("dict", "dictionary") and "columns" in column:
+            needs_flatten = True
+            for child in reversed(column.get("columns", [])):
+                stack.append((child, path + (col_name,)))
+            continue
+
+        if col_type == "list" and "columns" in column:
+            field_type = ArrayType(_build_nested_schema(column))
+        else:
+            field_type = _TYPE_MAPPING.get(col_type, StringType())
+        name = "_".join(path + (col_name,)) if path else col_name
+        fields.append(StructField(name, field_type, True))
+
+    return StructType(fields), needs_flatten
+
+
+@functools.lru_cache(maxsize=None)
+def _load_schema(schema_path: str) -> tuple:
+    """
+    Parse a dataset schema file once and cache the derived artifacts by path.
+
+    Multiple ingestors pointing at the same dataset share the parsed output, so
+    subsequent constructions skip both the YAML parse and the StructType build.
+
+    Args:
+        schema_path (str): Path to the dataset schema YAML file.
+
+    Returns:
+        tuple: A (StructType, responsePath, pagination, needs_flatten) tuple for the dataset.
+
+    Raises:
+        ValueError: If the "responsePath" or "pagination" key is missing in the schema YAML.
+    """
+    with open(schema_path, "r", encoding="utf-8") as f:
+        schema_yaml = yaml.load(f, Loader=SafeLoader)
+
+    schema, needs_flatten = _build_schema(schema_yaml)
+
+    response_path = schema_yaml.get("responsePath")
+    if response_path is None:
+        raise ValueError("Missing 'responsePath' in schema YAML.")
+
+    pagination = schema_yaml.get("pagination")
+    if pagination is None:
+        raise ValueError("Missing 'pagination' in schema YAML.")
+
+    return schema, response_path, pagination, needs_flatten
+
+
+def _parse_json(response) -> dict:
+    """
+    Parse a fully buffered response body, preferring orjson when importable.
+
+    Args:
+        response (requests.Response): The HTTP response to parse.
+
+    Returns:
+        dict: The parsed JSON payload.
+
+    Raises:
+        ValueError: If the body is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _compile_result_accessor(result_path: str):
+    """
+    Compile a responsePath into a reusable accessor function.
+
+    A plain key compiles to a single dict lookup; a dotted path compiles to a
+    walk over the pre-split parts, so the path is only ever split once per
+    ingestor instead of being re-interpreted on every page.
+
+    Args:
+        result_path (str): The responsePath from the dataset schema, optionally dotted.
+
+    Returns:
+        Callable: A function mapping a parsed response dict to the extracted
+        results, or None when the path is absent.
+    """
+    parts = result_path.split(".")
+    if len(parts) == 1:
+        key = parts[0]
+        return lambda data: data.get(key)
+
+    def accessor(data, parts=tuple(parts)):
+        for part in parts:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(part)
+        return data
+
+    return accessor
+
+
+def _fetch_pages_partition(
+    pages, full_url: str, headers: dict, query_params: dict, extract, timeout: int, flatten: bool = False
+):
+    """
+    Fetch a partition's worth of pages on a Spark worker, yielding rows.
+
+    This is a module-level function so Spark can pickle it into tasks. Each
+    partition opens one keep-alive session and reuses it for all of its pages,
+    so the per-page TCP/TLS handshake is paid once per partition rather than
+    once per request, and JSON parsing runs on the worker instead of the driver.
+
+    Args:
+        pages (Iterable[int]): The page numbers assigned to this partition.
+        full_url (str): The full API URL.
+        headers (dict): Request headers.
+        query_params (dict): Base query parameters; copied before the page number is applied.
+        extract (Callable): Compiled accessor extracting results from the parsed response.
+        timeout (int): Request timeout in seconds.
+        flatten (bool): Whether to flatten nested record dictionaries to match a flattened schema.
+
+    Yields:
+        dict: The rows extracted from each page; empty pages contribute nothing.
+
+    Raises:
+        ValueError: If a request fails or a response body is not valid JSON.
+    """
+    session = _build_session()
+
+    for page in pages:
+        params = dict(query_params or {})
+        params["page"] = str(page)
+        response = session.get(full_url, headers=headers, params=params, timeout=timeout)
+        if not response.ok:
+            raise ValueError(f"Request failed on page {page} with status code {response.status_code}: {response.text}")
+        try:
+            data = _parse_json(response)
+        except ValueError as exc:
+            raise ValueError(f"Failed to decode JSON on page {page}. Response text: {response.text}") from exc
+
+        rows = extract(data) or []
+        if flatten:
+            rows = (flatten_nested_dict(row) for row in rows)
+        yield from rows
+
 
 class BaseIngestor:
     """
@@ -67,93 +354,80 @@ class BaseIngestor:
         self.layer = layer
         self.query_params = query_params
         self.df = None
+        # Handle to the DataFrame read() cached; process() reassigns self.df to a
+        # derived frame, so write() must unpersist through this handle instead
+        self._cached_df = None
+
+        # All ingestors share the driver-level pooled session, so keep-alive
+        # connections persist across datasets as well as pages
+        self._session = _SESSION
 
         self.schema_path = (
             f"src/tdw/ingest/datasets/{self.source_config['name']}/schema/{self.dataset_config['name']}.yaml"
         )
-        self.schema = self.__get_schema()
-        self.result_path = self.__get_result_path()
-        self.pagination = self.__get_pagination_config()
-
-        # Create target schema
-        self.target.execute(f"CREATE SCHEMA IF NOT EXISTS {self.layer}")
-
-    def __get_schema(self) -> StructType:
-        """
-        Private method to generate a Spark StructType schema from a YAML file.
-
-        This method reads a YAML file specified by `self.schema_path` and constructs
-        a Spark StructType schema based on the structure and data types defined in the YAML.
-        It supports nested schemas for dictionaries and lists.
+        self.schema, self.result_path, self.pagination, self._needs_flatten = _load_schema(self.schema_path)
+        self._result_accessor = _compile_result_accessor(self.result_path)
 
-        Returns:
-            StructType: A Spark StructType object representing the schema.
+        # Create target schema once per process
+        if self.layer not in _ENSURED_SCHEMAS:
+            with _ENSURED_SCHEMAS_LOCK:
+                if self.layer not in _ENSURED_SCHEMAS:
+                    self.target.execute(f"CREATE SCHEMA IF NOT EXISTS {self.layer}")
+                    _ENSURED_SCHEMAS.add(self.layer)
 
-        Raises:
-            FileNotFoundError: If the schema file specified by `self.schema_path` does not exist.
-            yaml.YAMLError: If there is an error parsing the YAML file.
-        """
-        with open(self.schema_path, "r", encoding="utf-8") as f:
-            schema_yaml = yaml.safe_load(f)
-
-        type_mapping = {
-            "float": FloatType(),
-            "integer": IntegerType(),
-            "string": StringType(),
-            "boolean": BooleanType(),
-            "timestamp": TimestampType(),
-        }
-
-        def build_schema(schema_dict: dict) -> StructType:
-            fields = []
-            for column in schema_dict.get("columns", []):
-                col_name = column.get("name")
-                col_type = column.get("type")
-                if col_type in ("dict", "dictionary", "list") and "columns" in column:
-                    nested_schema = build_schema(column)
-                    field_type = ArrayType(nested_schema) if col_type == "list" else nested_schema
-                else:
-                    field_type = type_mapping.get(col_type, StringType())
-                fields.append(StructField(col_name, field_type, True))
-            return StructType(fields)
-
-        return build_schema(schema_yaml)
-
-    def __get_result_path(self) -> str:
+    def _fetch_page(self, full_url: str, headers: dict, query_params: dict, result_path: str, page: int) -> list:
         """
-        Private method to retrieve the response path from the schema YAML file.
+        Fetch a single page of results through the pooled session.
 
-        Reads the YAML file specified by `self.schema_path` and extracts the value
-        associated with the "responsePath" key. If the key is not found, a ValueError
-        is raised.
+        Args:
+            full_url (str): The full API URL.
+            headers (dict): Request headers.
+            query_params (dict): Base query parameters; copied before the page number is applied.
+            result_path (str): The key used to retrieve results from the JSON response.
+            page (int): The page number to request.
 
         Returns:
-            str: The response path extracted from the schema YAML.
+            list: The results extracted from the page, or None when the page is empty.
 
         Raises:
-            ValueError: If the "responsePath" key is missing in the schema YAML.
+            ValueError: If the request fails or the response body is not valid JSON.
         """
-        with open(self.schema_path, "r", encoding="utf-8") as f:
-            schema_yaml = yaml.safe_load(f)
-        response_path = schema_yaml.get("responsePath")
-        if response_path is None:
-            raise ValueError("Missing 'responsePath' in schema YAML.")
-        return response_path
-
-    def __get_pagination_config(self) -> dict:
-        with open(self.schema_path, "r", encoding="utf-8") as f:
-            schema_yaml = yaml.safe_load(f)
-        response_path = schema_yaml.get("pagination")
-        if response_path is None:
-            raise ValueError("Missing 'pagination' in schema YAML.")
-        return response_path
-
-    def _paginate(
-        self, full_url: str, headers: dict, query_params: dict, result_path: str, max_pages: int = None
-    ) -> list:
+        params = dict(query_params or {})
+        params["page"] = str(page)
+        timeout = self.source_config.get("variables", {}).get("timeout", 30)
+
+        if ijson is not None:
+            with self._session.get(full_url, headers=headers, params=params, timeout=timeout, stream=True) as response:
+                if not response.ok:
+                    raise ValueError(
+                        f"Request failed on page {page} with status code {response.status_code}: {response.text}"
+                    )
+                response.raw.decode_content = True
+                try:
+                    # Yield the rows under result_path directly without building the wrapper dict
+                    return list(ijson.items(response.raw, f"{result_path}.item"))
+                except ijson.JSONError as exc:
+                    raise ValueError(f"Failed to decode JSON on page {page}.") from exc
+
+        response = self._session.get(full_url, headers=headers, params=params, timeout=timeout)
+        if not response.ok:
+            raise ValueError(f"Request failed on page {page} with status code {response.status_code}: {response.text}")
+        try:
+            data = _parse_json(response)
+        except ValueError as exc:
+            raise ValueError(f"Failed to decode JSON on page {page}. Response text: {response.text}") from exc
+
+        return self._result_accessor(data)
+
+    def _paginate(self, full_url: str, headers: dict, query_params: dict, result_path: str) -> list:
         """
         Paginates through results by incrementing the 'page' query parameter until no results are returned.
 
+        This driver-side path handles paginations of unknown length; pages are fetched
+        sequentially over the pooled session until an empty page is returned. When
+        `maxPages` is known, `read()` distributes the page fetches across Spark
+        executors instead.
+
         Args:
             full_url (str): The full API URL.
             headers (dict): Request headers.
@@ -163,27 +437,11 @@ class BaseIngestor:
         Returns:
             list: Combined list of all results from each page.
         """
-        # TODO: Improve pagination handling - when to stop, how many pages to fetch, etc.
-        page = 1
+        # TODO: Fetch unknown-length paginations in speculative windows instead of one page at a time
         all_results = []
-        while True if max_pages is None else page <= max_pages:
-            query_params["page"] = str(page)
-            response = requests.get(
-                full_url,
-                headers=headers,
-                params=query_params,
-                timeout=self.source_config.get("variables", {}).get("timeout", 30),
-            )
-            if not response.ok:
-                raise ValueError(
-                    f"Request failed on page {page} with status code {response.status_code}: {response.text}"
-                )
-            try:
-                data = response.json()
-            except requests.exceptions.JSONDecodeError as exc:
-                raise ValueError(f"Failed to decode JSON on page {page}. Response text: {response.text}") from exc
-
-            page_result = data.get(result_path)
+        page = 1
+        while True:
+            page_result = self._fetch_page(full_url, headers, query_params, result_path, page)
             if not page_result:
                 # Exit when no results are returned
                 break
@@ -218,61 +476,140 @@ class BaseIngestor:
             raise ValueError("Missing headers in source configuration.")
 
         query_params = self.query_params
-        # TODO: Process requests on worker nodes
+        timeout = self.source_config.get("variables", {}).get("timeout", 30)
         # TODO: Verify if API response is successful and handle errors
         if pagination["enabled"]:
-            result = self._paginate(full_url, headers, query_params, result_path, pagination.get("maxPages", None))
+            max_pages = pagination.get("maxPages", None)
+            if max_pages is not None:
+                # Distribute the page range across executors; each partition fetches
+                # its pages over one reused session and parses responses locally,
+                # so ingest scales with executor count instead of serializing on
+                # the driver
+                num_slices = min(max_pages, spark.sparkContext.defaultParallelism * 4, 64)
+                pages = spark.sparkContext.parallelize(range(1, max_pages + 1), numSlices=num_slices)
+                extract = self._result_accessor
+                flatten = self._needs_flatten
+                rows = pages.mapPartitions(
+                    lambda it: _fetch_pages_partition(it, full_url, headers, query_params, extract, timeout, flatten)
+                )
+                # Cache so downstream stages cannot trigger a second round of API calls
+                self.df = spark.createDataFrame(rows, schema).cache()
+                self._cached_df = self.df
+                return self
+            result = self._paginate(full_url, headers, query_params, result_path)
+        elif ijson is not None:
+            with self._session.get(
+                full_url,
+                headers=headers,
+                params=query_params,
+                timeout=timeout,
+                stream=True,
+            ) as response:
+                response.raw.decode_content = True
+                result = list(ijson.items(response.raw, f"{result_path}.item"))
         else:
-            response = requests.get(
+            response = self._session.get(
                 full_url,
                 headers=headers,
                 params=query_params,
-                timeout=self.source_config.get("variables", {}).get("timeout", 30),
+                timeout=timeout,
             )
-            data = response.json()
-            result = data[result_path]
+            data = _parse_json(response)
+            result = self._result_accessor(data)
+
+        if self._needs_flatten:
+            # Flatten nested record dicts so rows line up with the flattened schema
+            result = [flatten_nested_dict(record) for record in result]
 
-        df = spark.createDataFrame(result, schema)
+        if pd is not None and result:
+            # The Arrow conversion path expects columns in schema order
+            pdf = pd.DataFrame(result, columns=schema.fieldNames())
+            df = spark.createDataFrame(pdf, schema)
+        else:
+            df = spark.createDataFrame(result, schema)
 
-        self.df = df
+        # Cache so downstream stages re-use the materialized rows instead of re-deriving them
+        self.df = df.cache()
+        self._cached_df = self.df
         return self
 
     def process(self):
         """
-        Processes the ingestor's DataFrame by appending a SHA-256 hash of each row
+        Processes the ingestor's DataFrame by appending an xxHash64 hash of each row
         and a processing timestamp.
 
         This method performs the following operations on self.df:
-        1. Computes a SHA-256 hash across all existing column values in each row,
-            separated by "||", and stores the result in a new column "_rowHash".
+        1. Computes an xxHash64 hash across all existing column values in each row
+            and stores the result in a new column "_rowHash". The hash is used for
+            row change tracking only, so the fast non-cryptographic xxHash64 is
+            preferred over SHA-256.
         2. Adds a new column "_processedTimestamp" containing the current processing time.
 
+        Both columns are added in a single select so Catalyst sees one projection
+        instead of one plan node per withColumn.
+
         Returns:
              self: The ingestor instance with the updated DataFrame (self.df).
         """
         df = self.df
-
-        df = df.withColumn("_rowHash", sha2(concat_ws("||", *[col(c) for c in df.columns]), 256))
-        df = df.withColumn("_processedTimestamp", current_timestamp())
-        self.df = df
+        # Exclude the audit columns themselves: dataset schemas declare them, so they
+        # arrive as nulls from read() and are replaced by the expressions below
+        base_columns = [col(c) for c in df.columns if c not in ("_rowHash", "_processedTimestamp")]
+
+        self.df = df.select(
+            *base_columns,
+            xxhash64(*base_columns).cast("string").alias("_rowHash"),
+            current_timestamp().alias("_processedTimestamp"),
+        )
 
         return self
 
     def write(self):
         """
-        Write the current DataFrame to a JDBC table.
+        Write the current DataFrame to a JDBC table via a staging table.
 
         Constructs the target table name from `self.layer`, `self.source_config['name']`
-        and `self.dataset_config['name']`, then writes `self.df` to the configured
-        JDBC URL using overwrite mode and the provided connection properties.
+        and `self.dataset_config['name']`, writes `self.df` to a `__staging` sibling
+        using overwrite mode and the provided connection properties, then atomically
+        swaps the staging table into place with a DROP + RENAME in one transaction.
+        Readers see either the old table or the new one, never a half-loaded table.
+        The DataFrame is repartitioned so several JDBC writers run in parallel,
+        and the staging overwrite truncates rather than dropping and recreating
+        the table. Partition count and JDBC batch size can be tuned per dataset
+        via the `write_partitions` and `batchsize` keys in the dataset's input
+        configuration, falling back to the source's `write_partitions` variable
+        and the connection-level batch size.
 
         Returns:
             Ingestor: The same instance (self) for method chaining.
         """
-        table_name = f"{self.layer}.{self.source_config['name']}_{self.dataset_config['name']}"
+        short_name = f"{self.source_config['name']}_{self.dataset_config['name']}"
+        table_name = f"{self.layer}.{short_name}"
+        staging_table = f"{table_name}__staging"
 
         jdbc_url = self.target.jdbc_url
         connection_properties = self.target.connection_properties
+        num_partitions = self.dataset_config.get(
+            "write_partitions", self.source_config.get("variables", {}).get("write_partitions", 8)
+        )
 
-        self.df.write.jdbc(url=jdbc_url, table=table_name, mode="overwrite", properties=connection_properties)
+        writer = (
+            self.df.repartition(num_partitions)
+            .write.option("truncate", "true")
+            .option("isolationLevel", "NONE")
+            # Explicit so the JDBC side opens one connection per repartitioned slice
+            .option("numPartitions", num_partitions)
+        )
+        batch_size = self.dataset_config.get("batchsize")
+        if batch_size:
+            writer = writer.option("batchsize", batch_size)
+        writer.jdbc(url=jdbc_url, table=staging_table, mode="overwrite", properties=connection_properties)
+        # Both statements run in one command and commit together, so the swap is atomic
+        self.target.execute(f"DROP TABLE IF EXISTS {table_name}; ALTER TABLE {staging_table} RENAME TO {short_name}")
+        # Release the cached rows now that they have been written out. unpersist
+        # only frees blocks for the exact cached plan, so it must run against the
+        # frame read() cached, not the derived frame process() left in self.df
+        if self._cached_df is not None:
+            self._cached_df.unpersist()
+            self._cached_df = None
         return self
@@ -34,26 +34,34 @@ Example:
 
 """
 
+import copy
 import logging
 import argparse
 import os
 import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv, find_dotenv
-from pyspark.sql import SparkSession
 
 from tdw.utils.helpers import filter_sources, filter_datasets, replace_api_key
-from tdw.config.spark import get_session
 from tdw.config.auth import PostgresAuth
 from tdw.config.configure import ConfigLoader
-from tdw.ingest.sources import load_sources
+
+# Shared read-only fallback for datasets without an entry in the input config,
+# so config lookups on a miss do not allocate a fresh dict per iteration
+_EMPTY_CONFIG = types.MappingProxyType({})
+
+# Rendered once at import; the explicit datefmt keeps asctime to a single
+# strftime call per record instead of the default strftime + millisecond concat
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 handler = logging.StreamHandler()
 handler.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-handler.setFormatter(formatter)
+handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
 logger.addHandler(handler)
 
 
@@ -65,19 +73,21 @@ def ingest(dataset_name: str):
         1. Loads the global input configuration using ConfigLoader.
         2. Retrieves all available sources and filters them based on the input
            configuration and the specified dataset name.
-        3. For each source, loads its specific configuration and updates the source
-           to use BaseAPIAuth with its dedicated settings.
-        4. Checks if any sources are available; if none are found, logs a warning
+        3. Checks if any sources are available; if none are found, logs a warning
            and exits the program.
-        5. Initializes a SparkSession and a PostgresAuth target for managing output.
-        6. For each source and each of its datasets:
+        4. Initializes a SparkSession.
+        5. For each source (submitted to a thread pool, since each pipeline is
+           dominated by network and Spark-job waits) and each of its datasets:
+             - Loads the source's specific configuration and updates the source
+               to use BaseAPIAuth with its dedicated settings.
              - Retrieves source-specific and dataset-specific configurations.
              - Replaces any occurrences of '{api_key}' in the configuration with the
-               corresponding environment variable value. Raises a ValueError if the
-               required environment variable is missing.
+               environment variable value resolved up front for every source; a
+               missing variable raises a ValueError before any worker starts.
              - Logs the ingestion process for the current source and dataset.
              - Executes a data processing chain: read, process, and write operations.
-        7. Closes the database connection after all processing is complete.
+        6. Returns each worker's database connection to the pool once its source
+           completes (the PostgresAuth target is used as a context manager).
 
     Parameters:
         dataset_name (str): The name of the dataset to be ingested.
@@ -85,6 +95,11 @@ def ingest(dataset_name: str):
     Raises:
         ValueError: If the required environment variable for a source's API key is not found.
     """
+    # Imported here so --help and non-Spark actions skip the pyspark import
+    # and JVM-gateway bootstrap entirely
+    from tdw.config.spark import get_session
+    from tdw.ingest.sources import load_sources
+
     cl = ConfigLoader()
     input_config = cl.load_input_config()
 
@@ -92,43 +107,58 @@ def ingest(dataset_name: str):
     sources = filter_sources(sources, input_config)
     sources = filter_datasets(sources, dataset_name)
 
-    # Update each source to use its specific configuration with BaseAPIAuth
-    for source in sources:
-        source_config = cl.load_source_config(source.name)
-        source.config = source.config(source_config=source_config)
-
     if not sources:
         logger.warning("No sources found for the specified dataset.")
         sys.exit(0)
 
-    spark: SparkSession = get_session()
-    target = PostgresAuth(source_config)
+    spark = get_session()
+    sources_map = input_config.get("sources", {})
 
+    # Resolve every source's API key up front: one env lookup per source and a
+    # fail-fast error before any worker starts fetching
+    env_keys = {}
     for source in sources:
-        input_source_config = input_config.get("sources", {}).get(source.name, {})
+        env_name = f"{source.name.upper()}_KEY"
+        api_key_value = os.getenv(env_name)
+        if not api_key_value:
+            raise ValueError(f"Variable {env_name} not found in environment variables.")
+        env_keys[source.name] = api_key_value
+
+    def _run_source(source):
+        """Run the full read/process/write pipeline for one source."""
+        input_source_config = sources_map.get(source.name, _EMPTY_CONFIG)
+        # Update the source to use its specific configuration with BaseAPIAuth,
+        # right where the configuration is consumed
+        source.config = source.config(source_config=cl.load_source_config(source.name))
         source_config = source.config.get_config()
 
-        # Replace all occurrences of '{api_key}' with the corresponding environment variable value
-        api_key_value = os.getenv(f"{source.name.upper()}_KEY")
-        if api_key_value:
-            source_config = replace_api_key(source_config, api_key_value)
-        else:
-            raise ValueError(f"Variable {source.name.upper()}_KEY not found in environment variables.")
-
-        for dataset in source.datasets:
-            dataset_config = input_source_config.get("datasets", {}).get(dataset.name, {})
-            logger.info("Ingesting %s.%s", source.name, dataset.name)
-            source.process(
-                spark,
-                source_config,
-                dataset_config,
-                dataset.endpoint,
-                target,
-                "bronze",
-                dataset.query_params,
-            ).read().process().write()
-
-    target.close_connection()
+        # Replace all occurrences of '{api_key}' with the pre-resolved environment
+        # value. The config comes from the memoized loader, so substitute into a
+        # deep copy: mutating the cached dict would leak the secret into every
+        # later load_source_config result
+        source_config = replace_api_key(copy.deepcopy(source_config), env_keys[source.name])
+
+        # Each worker checks out its own pooled connection, so writes from
+        # concurrent sources never share a cursor
+        datasets_config = input_source_config.get("datasets", _EMPTY_CONFIG)
+        with PostgresAuth(input_config) as target:
+            for dataset in source.datasets:
+                dataset_config = datasets_config.get(dataset.name, _EMPTY_CONFIG)
+                logger.info("Ingesting %s.%s", source.name, dataset.name)
+                source.process(
+                    spark,
+                    source_config,
+                    dataset_config,
+                    dataset.endpoint,
+                    target,
+                    "bronze",
+                    dataset.query_params,
+                ).read().process().write()
+
+    # Each source is an independent HTTP + Spark + Postgres pipeline dominated
+    # by I/O waits, so sources run concurrently; the first failure propagates
+    with ThreadPoolExecutor(max_workers=min(len(sources), 8)) as executor:
+        list(executor.map(_run_source, sources))
 
 
 def transform():
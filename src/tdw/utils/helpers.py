@@ -4,6 +4,19 @@ Utility functions module.
 This module provides common utility functions used across the application.
 """
 
+import re
+
+# Compiled once at import so every config walk shares the same pattern;
+# matches {name}-style placeholders such as {api_key}
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# Exact-type dispatch for the placeholder walk: a single dict lookup on
+# type(value) classifies each node without walking the MRO the way
+# isinstance does. Subclasses of str/dict/list fall back to isinstance.
+_SUBSTITUTE = "substitute"
+_DESCEND = "descend"
+_PLACEHOLDER_DISPATCH = {str: _SUBSTITUTE, dict: _DESCEND, list: _DESCEND}
+
 
 def filter_sources(sources, config):
     """
@@ -14,12 +27,17 @@ def filter_sources(sources, config):
     :return: A list of filtered source objects with only the enabled datasets.
     """
     enabled_sources = []
+    sources_config = config.get("sources", {})
     for source in sources:
-        source_config = config.get("sources", {}).get(source.name, {})
-        if source_config.get("enabled", False):
-            datasets_config = source_config.get("datasets", {})
-            source.datasets = [d for d in source.datasets if datasets_config.get(d.name, {}).get("enabled", False)]
-            enabled_sources.append(source)
+        source_config = sources_config.get(source.name)
+        if not source_config or not source_config.get("enabled", False):
+            continue
+        datasets_config = source_config.get("datasets", {})
+        # One pass over the config builds a set, so the dataset filter below is
+        # an O(1) membership test instead of two dict lookups per dataset
+        enabled_names = {name for name, cfg in datasets_config.items() if cfg.get("enabled", False)}
+        source.datasets = [d for d in source.datasets if d.name in enabled_names]
+        enabled_sources.append(source)
     return enabled_sources
 
 
@@ -35,38 +53,103 @@ def filter_datasets(sources, dataset_name):
     Returns:
         list: A filtered list of sources.
     """
-    if "." in dataset_name:
-        source_filter, dataset_filter = dataset_name.split(".", 1)
-        filtered_sources = []
-        for source in sources:
-            if source.name == source_filter:
-                filtered_datasets = [ds for ds in source.datasets if ds.name == dataset_filter]
-                if filtered_datasets:
-                    source.datasets = filtered_datasets
-                    filtered_sources.append(source)
-        return filtered_sources
-    return sources
+    # partition scans the string once for both the membership test and the split
+    source_filter, sep, dataset_filter = dataset_name.partition(".")
+    if not sep:
+        return sources
+    filtered_sources = []
+    for source in sources:
+        if source.name == source_filter:
+            # Dataset names are unique within a source, so stop at the first match
+            match = next((ds for ds in source.datasets if ds.name == dataset_filter), None)
+            if match is not None:
+                source.datasets = [match]
+                filtered_sources.append(source)
+    return filtered_sources
 
 
-def replace_api_key(obj, api_key_value):
+def flatten_nested_dict(raw):
+    """
+    Flattens a nested dictionary into a single level, joining key paths with underscores.
+
+    The walk is iterative (an explicit stack of (node, key-path) pairs) rather than
+    recursive, and key paths are kept as tuples so the joined string key is only
+    built once per leaf value.
+
+    Args:
+        raw (dict): The nested dictionary to flatten.
+
+    Returns:
+        dict: A flat dictionary mapping underscore-joined key paths to leaf values.
+    """
+    flat = {}
+    stack = [(raw, ())]
+    while stack:
+        node, path = stack.pop()
+        if isinstance(node, dict) and node:
+            # Reversed so the stack pops children in their original order
+            for key, value in reversed(node.items()):
+                stack.append((value, path + (key,)))
+        else:
+            flat["_".join(path)] = node
+    return flat
+
+
+def replace_placeholders(obj, replacements):
     """
-    Recursively replaces all occurrences of the placeholder "{api_key}" in a given object
-    with the provided api_key_value. The function traverses nested structures, handling
-    dictionaries and lists by processing their elements recursively.
-    For string values, it replaces the placeholder with api_key_value. All other data types are returned unchanged.
+    Replaces {name}-style placeholders in a given object with values from a mapping.
+    Dictionaries and lists are mutated in place using an explicit stack instead of
+    recursion, so no new containers (or recursion frames) are allocated. Containers
+    referenced from multiple places are visited once via an id() set. All placeholders
+    in a string are substituted in a single pass of the precompiled pattern; names
+    missing from the mapping are left untouched.
 
     Args:
         obj: The input object which can be a dictionary, list, or any other type. If it's a dictionary or list,
-             the function will recursively process its elements.
-        api_key_value (str): The string that will replace any occurrence of "{api_key}" found in string values.
+             the function will process its elements in place.
+        replacements (dict): Mapping of placeholder names (without braces) to their replacement strings.
 
     Returns:
-        The processed object with the "{api_key}" placeholder replaced by api_key_value in all string values.
+        The same object with every known placeholder replaced in all string values.
     """
-    if isinstance(obj, dict):
-        return {k: replace_api_key(v, api_key_value) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [replace_api_key(item, api_key_value) for item in obj]
+
+    def substitute(match):
+        return replacements.get(match.group(1), match.group(0))
+
     if isinstance(obj, str):
-        return obj.replace("{api_key}", api_key_value)
+        return _PLACEHOLDER_RE.sub(substitute, obj) if "{" in obj else obj
+    if not isinstance(obj, (dict, list)):
+        return obj
+    stack = [obj]
+    visited = {id(obj)}
+    while stack:
+        current = stack.pop()
+        items = current.items() if isinstance(current, dict) else enumerate(current)
+        for key, value in items:
+            action = _PLACEHOLDER_DISPATCH.get(type(value))
+            if action is None and isinstance(value, (str, dict, list)):
+                action = _SUBSTITUTE if isinstance(value, str) else _DESCEND
+            if action is _SUBSTITUTE:
+                if "{" in value:
+                    current[key] = _PLACEHOLDER_RE.sub(substitute, value)
+            elif action is _DESCEND and id(value) not in visited:
+                visited.add(id(value))
+                stack.append(value)
     return obj
+
+
+def replace_api_key(obj, api_key_value):
+    """
+    Replaces all occurrences of the placeholder "{api_key}" in a given object with the
+    provided api_key_value. Thin wrapper around replace_placeholders for the single
+    placeholder the source configs use today.
+
+    Args:
+        obj: The input object which can be a dictionary, list, or any other type. If it's a dictionary or list,
+             the function will process its elements in place.
+        api_key_value (str): The string that will replace any occurrence of "{api_key}" found in string values.
+
+    Returns:
+        The same object with the "{api_key}" placeholder replaced by api_key_value in all string values.
+    """
+    return replace_placeholders(obj, {"api_key": api_key_value})
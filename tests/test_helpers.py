@@ -0,0 +1,70 @@
+"""
+Module: test_helpers
+
+This module contains unit tests for the utility helpers, focusing on replace_api_key.
+The tests cover placeholder substitution in nested dictionaries and lists, passthrough
+of non-string values, and the in-place handling of containers shared between branches
+of the same configuration tree.
+"""
+
+from src.tdw.utils.helpers import replace_api_key, replace_placeholders
+
+
+def test_replace_api_key_nested():
+    """
+    Test that replace_api_key substitutes the placeholder at every depth of a nested config.
+
+    The input mixes dictionaries, lists and plain strings, with the placeholder appearing
+    both embedded in a URL and as a standalone value. The test verifies that every
+    occurrence is replaced and that untouched strings are preserved.
+    """
+    config = {
+        "url": "https://api.example.com?key={api_key}",
+        "headers": {"x-api-key": "{api_key}"},
+        "params": [{"token": "{api_key}"}, "static"],
+    }
+    result = replace_api_key(config, "secret")
+    assert result["url"] == "https://api.example.com?key=secret"
+    assert result["headers"]["x-api-key"] == "secret"
+    assert result["params"] == [{"token": "secret"}, "static"]
+
+
+def test_replace_api_key_non_string_values():
+    """
+    Test that non-string leaf values pass through replace_api_key unchanged.
+
+    Integers, booleans and None must not be touched by the substitution pass,
+    and the function must not raise when encountering them inside containers.
+    """
+    config = {"retries": 3, "enabled": True, "timeout": None}
+    assert replace_api_key(config, "secret") == {"retries": 3, "enabled": True, "timeout": None}
+    assert replace_api_key(42, "secret") == 42
+
+
+def test_replace_placeholders_multiple_tokens():
+    """
+    Test that replace_placeholders substitutes several distinct tokens in one pass.
+
+    A string carrying two different placeholders must have both replaced from the
+    mapping, while a placeholder name absent from the mapping is left untouched.
+    """
+    config = {"url": "https://{host}/v1?key={api_key}", "note": "{unknown}"}
+    result = replace_placeholders(config, {"host": "api.example.com", "api_key": "secret"})
+    assert result["url"] == "https://api.example.com/v1?key=secret"
+    assert result["note"] == "{unknown}"
+
+
+def test_replace_api_key_mutates_in_place():
+    """
+    Test that replace_api_key mutates the given containers rather than rebuilding them.
+
+    The returned object must be the same instance that was passed in, and a container
+    referenced from two places in the tree must be processed without error and keep
+    its shared identity.
+    """
+    shared = {"token": "{api_key}"}
+    config = {"a": shared, "b": shared}
+    result = replace_api_key(config, "secret")
+    assert result is config
+    assert config["a"] is config["b"]
+    assert config["a"]["token"] == "secret"